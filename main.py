@@ -4,12 +4,15 @@ import yt_dlp as youtube_dl
 import asyncio
 import os
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import re
 import requests
 import json
 from urllib.parse import urlparse, parse_qs
 from dotenv import load_dotenv
 import random
+import time
+from difflib import SequenceMatcher
 from keep_alive import keep_alive
 
 # Load environment variables
@@ -20,8 +23,154 @@ intents = nextcord.Intents.default()
 intents.message_content = True
 bot = commands.Bot(command_prefix='!', intents=intents)
 
+# Metadata providers turn streaming-service links into artist/title pairs
+class MetadataProvider:
+    """Base provider; returns a list of track dicts or None if the link can't be read.
+
+    Each track dict has 'id', 'artist', 'title' and 'duration' (seconds or None).
+    Providers return at most `limit` tracks when one is given.
+    """
+    async def get_spotify_tracks(self, url, limit=None):
+        return None
+
+    async def get_apple_music_tracks(self, url, limit=None):
+        return None
+
+class WebMetadataProvider(MetadataProvider):
+    """Looks tracks up through the Spotify Web API and the public iTunes lookup API"""
+    SPOTIFY_API = 'https://api.spotify.com/v1'
+    SPOTIFY_TOKEN_URL = 'https://accounts.spotify.com/api/token'
+    ITUNES_LOOKUP_URL = 'https://itunes.apple.com/lookup'
+
+    def __init__(self, client_id=None, client_secret=None):
+        self.client_id = client_id or os.getenv('SPOTIFY_CLIENT_ID')
+        self.client_secret = client_secret or os.getenv('SPOTIFY_CLIENT_SECRET')
+        self._token = None
+        self._token_expires = 0
+
+    async def get_spotify_tracks(self, url, limit=None):
+        if not self.client_id or not self.client_secret:
+            print("Spotify lookup skipped: SPOTIFY_CLIENT_ID/SPOTIFY_CLIENT_SECRET not set")
+            return None
+        try:
+            return await asyncio.get_event_loop().run_in_executor(None, self._fetch_spotify, url, limit)
+        except Exception as e:
+            print(f"Error fetching Spotify metadata: {e}")
+            return None
+
+    async def get_apple_music_tracks(self, url, limit=None):
+        try:
+            return await asyncio.get_event_loop().run_in_executor(None, self._fetch_apple_music, url, limit)
+        except Exception as e:
+            print(f"Error fetching Apple Music metadata: {e}")
+            return None
+
+    def _spotify_token(self):
+        if self._token and time.time() < self._token_expires - 60:
+            return self._token
+        response = requests.post(
+            self.SPOTIFY_TOKEN_URL,
+            data={'grant_type': 'client_credentials'},
+            auth=(self.client_id, self.client_secret),
+            timeout=10
+        )
+        response.raise_for_status()
+        data = response.json()
+        self._token = data['access_token']
+        self._token_expires = time.time() + data.get('expires_in', 3600)
+        return self._token
+
+    def _spotify_get(self, url, params=None):
+        response = requests.get(
+            url,
+            headers={'Authorization': f'Bearer {self._spotify_token()}'},
+            params=params,
+            timeout=10
+        )
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _spotify_track(item):
+        # Local files and unavailable tracks come back without an id
+        if not item or not item.get('id'):
+            return None
+        duration_ms = item.get('duration_ms')
+        return {
+            'id': f"spotify:{item['id']}",
+            'artist': ', '.join(artist['name'] for artist in item.get('artists', [])),
+            'title': item.get('name', ''),
+            'duration': duration_ms // 1000 if duration_ms else None
+        }
+
+    def _fetch_spotify(self, url, limit=None):
+        match = re.search(r'spotify\.com/(?:intl-[\w-]+/)?(track|album|playlist)/([A-Za-z0-9]+)', url)
+        if not match:
+            return None
+        kind, item_id = match.groups()
+        if kind == 'track':
+            items = [self._spotify_get(f'{self.SPOTIFY_API}/tracks/{item_id}')]
+        else:
+            if kind == 'album':
+                page = self._spotify_get(f'{self.SPOTIFY_API}/albums/{item_id}/tracks', {'limit': 50})
+            else:
+                page = self._spotify_get(f'{self.SPOTIFY_API}/playlists/{item_id}/tracks', {'limit': 100})
+            items = []
+            while page:
+                for item in page.get('items', []):
+                    # Playlist items wrap the track; album items are the track
+                    items.append(item.get('track') if kind == 'playlist' else item)
+                # Stop paging once there's enough to fill the limit
+                if limit and len(items) >= limit:
+                    break
+                page = self._spotify_get(page['next']) if page.get('next') else None
+        tracks = [track for track in map(self._spotify_track, items) if track]
+        return tracks[:limit] or None
+
+    def _fetch_apple_music(self, url, limit=None):
+        parsed = urlparse(url)
+        parts = [part for part in parsed.path.split('/') if part]
+        kind = next((part for part in parts if part in ('album', 'song', 'playlist')), None)
+        if not kind or kind == 'playlist':
+            # Playlists need an Apple Music developer token
+            return None
+        country = parts[0] if len(parts[0]) == 2 else 'us'
+        song_id = parse_qs(parsed.query).get('i', [None])[0]
+        params = {'id': song_id or parts[-1], 'country': country}
+        if kind == 'album' and not song_id:
+            params.update({'entity': 'song', 'limit': 200})
+        response = requests.get(self.ITUNES_LOOKUP_URL, params=params, timeout=10)
+        response.raise_for_status()
+        tracks = []
+        for item in response.json().get('results', []):
+            if item.get('wrapperType') != 'track':
+                continue
+            duration_ms = item.get('trackTimeMillis')
+            tracks.append({
+                'id': f"apple:{item['trackId']}",
+                'artist': item.get('artistName', ''),
+                'title': item.get('trackName', ''),
+                'duration': duration_ms // 1000 if duration_ms else None
+            })
+        return tracks[:limit] or None
+
+class LocalMetadataProvider(MetadataProvider):
+    """In-memory stand-in that maps links to prepared track lists, for offline testing"""
+    def __init__(self, catalog=None):
+        self.catalog = catalog or {}
+
+    async def get_spotify_tracks(self, url, limit=None):
+        return (self.catalog.get(url) or [])[:limit] or None
+
+    async def get_apple_music_tracks(self, url, limit=None):
+        return (self.catalog.get(url) or [])[:limit] or None
+
 # Platform support functions
 class PlatformHandler:
+    # Swap for a LocalMetadataProvider to run without network access
+    metadata_provider = WebMetadataProvider()
+    MAX_LINK_TRACKS = 200  # tracks taken from one album/playlist link
+
     @staticmethod
     def is_spotify_url(url):
         return 'spotify.com' in url
@@ -42,13 +191,15 @@ class PlatformHandler:
     async def get_spotify_track_info(url):
         """Extract track info from Spotify URL"""
         try:
-            if '/track/' in url:
-                track_id = url.split('/track/')[1].split('?')[0]
-            else:
+            # Ask for one extra track to tell whether the link was cut short
+            limit = PlatformHandler.MAX_LINK_TRACKS
+            tracks = await PlatformHandler.metadata_provider.get_spotify_tracks(url, limit=limit + 1)
+            if not tracks:
                 return None
             return {
                 'platform': 'Spotify',
-                'search_query': None,
+                'tracks': tracks[:limit],
+                'truncated': len(tracks) > limit,
                 'url': url
             }
         except Exception as e:
@@ -59,9 +210,15 @@ class PlatformHandler:
     async def get_apple_music_info(url):
         """Extract track info from Apple Music URL"""
         try:
+            # Ask for one extra track to tell whether the link was cut short
+            limit = PlatformHandler.MAX_LINK_TRACKS
+            tracks = await PlatformHandler.metadata_provider.get_apple_music_tracks(url, limit=limit + 1)
+            if not tracks:
+                return None
             return {
                 'platform': 'Apple Music',
-                'search_query': None,
+                'tracks': tracks[:limit],
+                'truncated': len(tracks) > limit,
                 'url': url
             }
         except Exception as e:
@@ -69,10 +226,10 @@ class PlatformHandler:
             return None
     
     @staticmethod
-    async def search_youtube_for_track(artist, title):
+    async def search_youtube_for_track(artist, title, results=5):
         """Search YouTube for a track by artist and title"""
         search_query = f"{artist} {title}".strip()
-        return f"ytsearch:{search_query}"
+        return f"ytsearch{results}:{search_query}"
 
 # Enhanced yt-dlp options with more platform support
 ytdl_format_options = {
@@ -127,6 +284,105 @@ class YTDLSource(nextcord.PCMVolumeTransformer):
         filename = data['url'] if stream else ytdl.prepare_filename(data)
         return cls(nextcord.FFmpegPCMAudio(filename, **ffmpeg_options), data=data)
 
+# Streaming-link matching: resolve artist/title pairs to YouTube videos
+ytdl_search_options = {**ytdl_format_options, 'extract_flat': True, 'noplaylist': True}
+
+MATCH_BATCH_SIZE = 8  # concurrent YouTube lookups per batch
+FIRST_MATCH_BATCHES = 2  # batches tried for a link's first playable track before giving up
+MATCH_MIN_SCORE = 0.45
+MATCH_CACHE_SIZE = 2000
+
+# Dedicated pool so playlist matching doesn't starve the bot's other executor work
+match_executor = ThreadPoolExecutor(max_workers=MATCH_BATCH_SIZE, thread_name_prefix='match')
+
+# Source track id -> matched YouTube watch URL, title, duration and thumbnail
+resolved_track_cache = {}
+
+class PendingTrack:
+    """Matched YouTube video waiting in the queue; the audio source is built when it plays"""
+    def __init__(self, url, title, duration=None, thumbnail=None):
+        self.url = url
+        self.title = title
+        self.duration = duration
+        self.thumbnail = thumbnail
+
+    async def create_source(self, *, loop=None):
+        return await YTDLSource.from_url(self.url, loop=loop, stream=True)
+
+def search_youtube(query):
+    """Run a flat YouTube search; YoutubeDL isn't thread-safe, so each call gets its own"""
+    with youtube_dl.YoutubeDL(ytdl_search_options) as search_ytdl:
+        data = search_ytdl.extract_info(query, download=False)
+    return [entry for entry in (data or {}).get('entries') or [] if entry]
+
+def normalize_title(text):
+    """Lowercase a title and strip bracketed tags and video noise words"""
+    text = (text or '').lower()
+    text = re.sub(r'[\(\[][^\)\]]*[\)\]]', ' ', text)
+    text = re.sub(r'\b(official|video|audio|lyrics?|hd|hq|mv|visualizer)\b', ' ', text)
+    text = re.sub(r'[^\w\s]', ' ', text)
+    return ' '.join(text.split())
+
+def score_match(track, entry):
+    """Score a YouTube search entry against a track on title similarity and duration"""
+    wanted = normalize_title(f"{track['artist']} {track['title']}")
+    candidate = normalize_title(entry.get('title'))
+    channel = normalize_title(entry.get('channel') or entry.get('uploader'))
+    title_score = max(
+        SequenceMatcher(None, wanted, candidate).ratio(),
+        SequenceMatcher(None, wanted, f"{channel} {candidate}".strip()).ratio()
+    )
+    # Boost when the track title appears as whole words; short titles ("I", "22") also need the artist
+    track_title = normalize_title(track['title'])
+    if track_title and re.search(rf'\b{re.escape(track_title)}\b', candidate):
+        artist = normalize_title(track['artist'])
+        if len(track_title) >= 4 or (artist and artist in f"{channel} {candidate}"):
+            title_score = (1 + title_score) / 2
+    if track.get('duration') and entry.get('duration'):
+        # Full credit when durations agree, nothing once they're 30s apart
+        duration_score = max(0.0, 1 - abs(track['duration'] - entry['duration']) / 30)
+        return 0.6 * title_score + 0.4 * duration_score
+    return title_score
+
+def cache_match(track_id, match):
+    if len(resolved_track_cache) >= MATCH_CACHE_SIZE:
+        resolved_track_cache.pop(next(iter(resolved_track_cache)))
+    resolved_track_cache[track_id] = match
+
+async def match_track(track, *, loop=None):
+    """Find the best YouTube match for a track and return it as a PendingTrack"""
+    loop = loop or asyncio.get_event_loop()
+    try:
+        match = resolved_track_cache.get(track['id'])
+        if match is None:
+            query = await PlatformHandler.search_youtube_for_track(track['artist'], track['title'])
+            entries = await loop.run_in_executor(match_executor, search_youtube, query)
+            if not entries:
+                return None
+            score, best = max(((score_match(track, entry), entry) for entry in entries), key=lambda pair: pair[0])
+            if score < MATCH_MIN_SCORE:
+                print(f"No confident match for {track['artist']} - {track['title']} (best {score:.2f})")
+                return None
+            thumbnails = best.get('thumbnails') or []
+            match = {
+                'url': best.get('url') or f"https://www.youtube.com/watch?v={best['id']}",
+                'title': best.get('title') or f"{track['artist']} - {track['title']}",
+                'duration': best.get('duration'),
+                'thumbnail': thumbnails[-1].get('url') if thumbnails else None
+            }
+            cache_match(track['id'], match)
+        return PendingTrack(match['url'], match['title'], match['duration'], match['thumbnail'])
+    except Exception as e:
+        print(f"Error matching {track.get('artist')} - {track.get('title')}: {e}")
+        return None
+
+async def resolve_in_batches(tracks, *, loop=None):
+    """Match tracks concurrently in bounded batches, yielding matches in link order"""
+    for start in range(0, len(tracks), MATCH_BATCH_SIZE):
+        batch = tracks[start:start + MATCH_BATCH_SIZE]
+        matches = await asyncio.gather(*(match_track(track, loop=loop) for track in batch))
+        yield batch, matches
+
 class MusicQueue:
     def __init__(self):
         self.queue = deque()
@@ -135,6 +391,8 @@ class MusicQueue:
         self.loop_queue = False
         self.autoplay = True  # NEW: Autoplay enabled by default
         self.history = deque(maxlen=50)  # NEW: Keep track of played songs
+        self.resolve_tasks = []  # Background Spotify/Apple Music matching
+        self.loading = False  # play_next is taking a track off the queue and loading it
 
     def add_song(self, song):
         self.queue.append(song)
@@ -152,6 +410,14 @@ class MusicQueue:
         self.current = None
         return None
 
+    def put_back(self, song, previous):
+        """Undo get_next() for a song that couldn't start playing yet"""
+        if self.loop_queue and self.queue and self.queue[-1] is song:
+            self.queue.pop()
+        if not (self.loop and song is previous):
+            self.queue.appendleft(song)
+        self.current = previous
+
     def skip(self):
         if self.loop_queue and self.current and not self.loop:
             self.queue.append(self.current)
@@ -160,6 +426,13 @@ class MusicQueue:
     def clear(self):
         self.queue.clear()
         self.current = None
+        for task in self.resolve_tasks:
+            task.cancel()
+        self.resolve_tasks = []
+
+    def is_resolving(self):
+        self.resolve_tasks = [task for task in self.resolve_tasks if not task.done()]
+        return bool(self.resolve_tasks)
 
     def shuffle(self):
         import random
@@ -250,26 +523,25 @@ async def play(ctx, *, url):
         async with ctx.typing():
             platform_handler = PlatformHandler()
             queue = get_queue(ctx.guild.id)
-            if platform_handler.is_spotify_url(url):
-                embed = nextcord.Embed(
-                    title="⚠️ Spotify Support",
-                    description="Direct Spotify playback isn't supported due to DRM restrictions.\n"
-                               "Please provide the song name instead, and I'll find it on YouTube!",
-                    color=0xff6b35
-                )
-                embed.add_field(name="Tip", value="Try: `!play artist - song name` or copy the song title", inline=False)
-                await ctx.send(embed=embed)
-                return
-            elif platform_handler.is_apple_music_url(url):
-                embed = nextcord.Embed(
-                    title="⚠️ Apple Music Support",
-                    description="Direct Apple Music playback isn't supported due to DRM restrictions.\n"
-                               "Please provide the song name instead, and I'll find it on YouTube!",
-                    color=0xff6b35
-                )
-                embed.add_field(name="Tip", value="Try: `!play artist - song name` or copy the song title", inline=False)
-                await ctx.send(embed=embed)
-                return
+            if platform_handler.is_spotify_url(url) or platform_handler.is_apple_music_url(url):
+                if platform_handler.is_spotify_url(url):
+                    platform = "Spotify"
+                    info = await platform_handler.get_spotify_track_info(url)
+                else:
+                    platform = "Apple Music"
+                    info = await platform_handler.get_apple_music_info(url)
+                if not info:
+                    embed = nextcord.Embed(
+                        title=f"⚠️ {platform} Support",
+                        description=f"I couldn't read the tracks behind this {platform} link.\n"
+                                   "Please provide the song name instead, and I'll find it on YouTube!",
+                        color=0xff6b35
+                    )
+                    embed.add_field(name="Tip", value="Try: `!play artist - song name` or copy the song title", inline=False)
+                    await ctx.send(embed=embed)
+                    return
+                if not await add_streaming_tracks(ctx, queue, info):
+                    return
             elif platform_handler.is_soundcloud_url(url) or platform_handler.is_youtube_url(url) or not url.startswith('http'):
                 result = await YTDLSource.from_url(url, loop=bot.loop, stream=True)
                 if isinstance(result, list):
@@ -309,6 +581,7 @@ async def play(ctx, *, url):
                     description="This platform is not supported. Try:\n"
                                "• YouTube URLs or search terms\n"
                                "• SoundCloud URLs\n"
+                               "• Spotify or Apple Music links\n"
                                "• Song names (I'll search YouTube)",
                     color=0xff0000
                 )
@@ -324,58 +597,199 @@ async def play(ctx, *, url):
         )
         await ctx.send(embed=error_embed)
 
+def format_missing_tracks(missing):
+    missing_list = "\n".join(missing[:5])
+    if len(missing) > 5:
+        missing_list += f"\n... and {len(missing) - 5} more"
+    return missing_list
+
+async def add_streaming_tracks(ctx, queue, info):
+    """Queue the first matched batch right away and resolve the rest of the link in the background"""
+    platform = info['platform']
+    remaining = list(info['tracks'])
+    missing = []
+    queued = []
+    # Links queued while another is still resolving wait their turn to keep queue order
+    waiting = queue.is_resolving()
+    if not waiting:
+        attempted = 0
+        leading = remaining[:FIRST_MATCH_BATCHES * MATCH_BATCH_SIZE]
+        async for batch, matches in resolve_in_batches(leading, loop=bot.loop):
+            attempted += len(batch)
+            for track, match in zip(batch, matches):
+                if match:
+                    queue.add_song(match)
+                    queued.append(match)
+                else:
+                    missing.append(f"{track['artist']} - {track['title']}")
+            if queued:
+                break
+        remaining = remaining[attempted:]
+        if not queued:
+            embed = nextcord.Embed(
+                title="❌ No Match Found",
+                description=f"I couldn't find the first {attempted} of these {platform} tracks on YouTube.",
+                color=0xff0000
+            )
+            await ctx.send(embed=embed)
+            return False
+    if remaining:
+        previous = list(queue.resolve_tasks)
+        task = bot.loop.create_task(queue_remaining_tracks(ctx, queue, remaining, platform, previous, missing))
+        queue.resolve_tasks.append(task)
+        embed = nextcord.Embed(
+            title=f"{platform} Tracks Added",
+            description=f"Matching **{len(remaining)}** tracks on YouTube in the background",
+            color=0x00ff00
+        )
+        if queued:
+            value = f"**{queued[0].title}**"
+            if len(queued) > 1:
+                value += f" and {len(queued) - 1} more"
+            embed.add_field(name="Queued first", value=value, inline=False)
+        else:
+            embed.add_field(name="Waiting", value="These will be added after the previous link finishes", inline=False)
+    elif len(queued) == 1:
+        first = queued[0]
+        embed = nextcord.Embed(
+            title="🎵 Added to Queue",
+            description=f"**{first.title}**",
+            color=0x00ff00
+        )
+        if first.thumbnail:
+            embed.set_thumbnail(url=first.thumbnail)
+        embed.add_field(name="Matched from", value=platform, inline=True)
+        embed.add_field(name="Position in queue", value=len(queue.queue), inline=True)
+    else:
+        embed = nextcord.Embed(
+            title=f"{platform} Tracks Added",
+            description=f"Added **{len(queued)}** songs to the queue",
+            color=0x00ff00
+        )
+    if missing and not remaining:
+        embed.add_field(name=f"Not found ({len(missing)})", value=format_missing_tracks(missing), inline=False)
+    if info.get('truncated'):
+        embed.add_field(
+            name="Limit",
+            value=f"Only the first {len(info['tracks'])} tracks of this link were taken",
+            inline=False
+        )
+    await ctx.send(embed=embed)
+    return True
+
+async def queue_remaining_tracks(ctx, queue, tracks, platform, previous, missing):
+    """Background task: add matched tracks to the queue batch by batch, in link order"""
+    try:
+        if previous:
+            await asyncio.wait(previous)
+        added = 0
+        async for batch, matches in resolve_in_batches(tracks, loop=bot.loop):
+            for track, match in zip(batch, matches):
+                if match:
+                    queue.add_song(match)
+                    added += 1
+                else:
+                    missing.append(f"{track['artist']} - {track['title']}")
+            voice_client = ctx.voice_client
+            if voice_client and not queue.loading and not voice_client.is_playing() and not voice_client.is_paused():
+                await play_next(ctx)
+        embed = nextcord.Embed(
+            title=f"✅ {platform} Tracks Ready",
+            description=f"Matched **{added}** more tracks on YouTube",
+            color=0x00ff00
+        )
+        if missing:
+            embed.add_field(name=f"Not found ({len(missing)})", value=format_missing_tracks(missing), inline=False)
+        await ctx.send(embed=embed)
+    except Exception as e:
+        print(f"Error resolving {platform} tracks: {e}")
+
 # UPDATED: Enhanced play_next with autoplay and spam fix
 async def play_next(ctx):
     queue = get_queue(ctx.guild.id)
-    player = queue.get_next()
-    if not player and queue.autoplay and queue.current:
-        try:
-            print("Attempting autoplay...")
-            queue.add_to_history(queue.current)
-            related_song = await get_related_song(queue.current)
-            if related_song:
-                player = related_song
-                queue.current = player
+    # One caller at a time: a second play_next while a track loads would pop the next one and drop it
+    if queue.loading:
+        return
+    queue.loading = True
+    retry = False
+    try:
+        previous = queue.current
+        player = queue.get_next()
+        # Don't autoplay over a playlist whose next tracks are still being matched
+        if not player and queue.autoplay and queue.current and not queue.is_resolving():
+            try:
+                print("Attempting autoplay...")
+                queue.add_to_history(queue.current)
+                related_song = await get_related_song(queue.current)
+                if related_song:
+                    player = related_song
+                    queue.current = player
+                    embed = nextcord.Embed(
+                        title="🎲 Autoplay",
+                        description=f"Playing related song: **{player.title}**",
+                        color=0x9932cc
+                    )
+                    if player.thumbnail:
+                        embed.set_thumbnail(url=player.thumbnail)
+                    embed.set_footer(text="Use !autoplay off to disable autoplay")
+                    await ctx.send(embed=embed)
+                else:
+                    print("No related song found for autoplay.")
+            except Exception as e:
+                print(f"Autoplay error: {e}")
+        if isinstance(player, PendingTrack):
+            # Matched tracks only get a stream URL and ffmpeg process when they're about to play
+            pending = player
+            player = None
+            if not ctx.voice_client.is_playing():
+                try:
+                    player = await pending.create_source(loop=bot.loop)
+                except Exception as e:
+                    print(f"Error loading {pending.title}: {e}")
+                    await ctx.send(f"❌ Couldn't load **{pending.title}**, skipping")
+                    if queue.loop_queue and queue.queue and queue.queue[-1] is pending:
+                        queue.queue.pop()
+                    queue.current = None
+                    retry = bool(queue.queue)
+            if not retry and ctx.voice_client.is_playing():
+                # Something else started while this track loaded; keep it for later
+                if player:
+                    player.cleanup()
+                    player = None
+                queue.put_back(pending, previous)
+        if player and not ctx.voice_client.is_playing():
+            def after_playing(error):
+                if error:
+                    print(f'Player error: {error}')
+                if not ctx.voice_client.is_playing():
+                    coro = play_next(ctx)
+                    fut = asyncio.run_coroutine_threadsafe(coro, bot.loop)
+                    try:
+                        fut.result()
+                    except:
+                        pass
+            ctx.voice_client.play(player, after=after_playing)
+            # Release before awaiting so a track that ends immediately can still advance the queue
+            queue.loading = False
+            if len(queue.queue) > 0 or not hasattr(ctx, '_autoplay_notified'):
                 embed = nextcord.Embed(
-                    title="🎲 Autoplay",
-                    description=f"Playing related song: **{player.title}**",
-                    color=0x9932cc
+                    title="♛ Now Playing",
+                    description=f"**{player.title}**",
+                    color=0x0099ff
                 )
                 if player.thumbnail:
                     embed.set_thumbnail(url=player.thumbnail)
-                embed.set_footer(text="Use !autoplay off to disable autoplay")
+                if player.duration:
+                    minutes = player.duration // 60
+                    seconds = player.duration % 60
+                    embed.add_field(name="Duration", value=f"{minutes:02d}:{seconds:02d}", inline=True)
                 await ctx.send(embed=embed)
-            else:
-                print("No related song found for autoplay.")
-        except Exception as e:
-            print(f"Autoplay error: {e}")
-    if player and not ctx.voice_client.is_playing():
-        def after_playing(error):
-            if error:
-                print(f'Player error: {error}')
-            if not ctx.voice_client.is_playing():
-                coro = play_next(ctx)
-                fut = asyncio.run_coroutine_threadsafe(coro, bot.loop)
-                try:
-                    fut.result()
-                except:
-                    pass
-        ctx.voice_client.play(player, after=after_playing)
-        if len(queue.queue) > 0 or not hasattr(ctx, '_autoplay_notified'):
-            embed = nextcord.Embed(
-                title="♛ Now Playing",
-                description=f"**{player.title}**",
-                color=0x0099ff
-            )
-            if player.thumbnail:
-                embed.set_thumbnail(url=player.thumbnail)
-            if player.duration:
-                minutes = player.duration // 60
-                seconds = player.duration % 60
-                embed.add_field(name="Duration", value=f"{minutes:02d}:{seconds:02d}", inline=True)
-            await ctx.send(embed=embed)
-            if not len(queue.queue) > 0:
-                ctx._autoplay_notified = True
+                if not len(queue.queue) > 0:
+                    ctx._autoplay_notified = True
+    finally:
+        queue.loading = False
+    if retry:
+        await play_next(ctx)
 
 # NEW: Autoplay command
 @bot.command(name='autoplay', help='Toggle autoplay on/off')
@@ -604,16 +1018,16 @@ async def show_platforms(ctx):
         inline=False
     )
     embed.add_field(
-        name="⚠️ Search Only (DRM Protected)",
-        value="🎵 **Spotify** - Provide song names, I'll find on YouTube\n"
-              "🍎 **Apple Music** - Provide song names, I'll find on YouTube\n"
+        name="🔁 Matched on YouTube (DRM Protected)",
+        value="🎵 **Spotify** - Track, album and playlist links\n"
+              "🍎 **Apple Music** - Track and album links\n"
               "🎼 **Other platforms** - Provide song names for YouTube search",
         inline=False
     )
     embed.add_field(
         name="💡 Usage Tips",
         value="• Use URLs for direct playback (YouTube/SoundCloud)\n"
-              "• Use song names for other platforms\n"
+              "• Spotify/Apple Music links start playing while the rest is matched\n"
               "• Try: `!search spotify song name`\n"
               "• Or just: `!play artist - song title`",
         inline=False
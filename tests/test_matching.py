@@ -0,0 +1,93 @@
+import asyncio
+import random
+import time
+
+import pytest
+
+import main
+
+PLAYLIST_URL = 'https://open.spotify.com/playlist/local'
+
+CATALOG = {
+    PLAYLIST_URL: [
+        {'id': f'spotify:{n}', 'artist': f'Artist {n}', 'title': f'Song Number {n}', 'duration': 200 + n}
+        for n in range(1, 12)
+    ]
+}
+
+def fake_entries(query):
+    """Stand-in for a flat YouTube search: one good hit for '<artist> <title>'"""
+    title = query.split(':', 1)[1]
+    return [{'id': title.replace(' ', ''), 'title': title, 'channel': 'Uploads', 'duration': None}]
+
+@pytest.fixture(autouse=True)
+def local_pipeline(monkeypatch):
+    monkeypatch.setattr(main.PlatformHandler, 'metadata_provider', main.LocalMetadataProvider(CATALOG))
+    monkeypatch.setattr(main, 'resolved_track_cache', {})
+
+def run(coro):
+    return asyncio.run(coro)
+
+async def collect(tracks):
+    results = []
+    async for batch, matches in main.resolve_in_batches(tracks):
+        results.extend(zip(batch, matches))
+    return results
+
+TRACK = {'id': 'spotify:queen', 'artist': 'Queen', 'title': 'Bohemian Rhapsody', 'duration': 355}
+
+def test_official_upload_beats_cover_and_live_versions():
+    official = {'title': 'Queen – Bohemian Rhapsody (Official Video Remastered)', 'channel': 'Queen Official', 'duration': 359}
+    cover = {'title': 'Bohemian Rhapsody - Piano Cover', 'channel': 'Piano Guy', 'duration': 290}
+    live = {'title': 'Queen - Bohemian Rhapsody Live at Wembley 1986', 'channel': 'Queen Official', 'duration': 410}
+    scores = {name: main.score_match(TRACK, entry) for name, entry in
+              [('official', official), ('cover', cover), ('live', live)]}
+    assert max(scores, key=scores.get) == 'official'
+
+def test_unrelated_result_is_below_threshold():
+    unrelated = {'title': 'Never Gonna Give You Up', 'channel': 'Rick Astley', 'duration': 213}
+    assert main.score_match(TRACK, unrelated) < main.MATCH_MIN_SCORE
+
+def test_unrelated_results_are_rejected(monkeypatch):
+    monkeypatch.setattr(main, 'search_youtube',
+                        lambda query: [{'id': 'x', 'title': 'Never Gonna Give You Up', 'channel': 'Rick Astley'}])
+    assert run(main.match_track(TRACK)) is None
+    assert TRACK['id'] not in main.resolved_track_cache
+
+def test_missing_duration_falls_back_to_title_score():
+    entry = {'title': 'Queen - Bohemian Rhapsody', 'channel': 'Queen'}
+    track = dict(TRACK, duration=None)
+    assert main.score_match(TRACK, entry) == main.score_match(track, entry)
+    assert main.score_match(track, entry) > main.MATCH_MIN_SCORE
+
+def test_matches_are_cached_per_track_id(monkeypatch):
+    calls = []
+    def search(query):
+        calls.append(query)
+        return fake_entries(query)
+    monkeypatch.setattr(main, 'search_youtube', search)
+    first = run(main.match_track(TRACK))
+    second = run(main.match_track(TRACK))
+    assert len(calls) == 1
+    assert isinstance(second, main.PendingTrack)
+    assert (second.url, second.title) == (first.url, first.title)
+
+def test_resolve_in_batches_keeps_link_order(monkeypatch):
+    def slow_search(query):
+        time.sleep(random.uniform(0, 0.02))
+        return fake_entries(query)
+    monkeypatch.setattr(main, 'search_youtube', slow_search)
+    monkeypatch.setattr(main, 'MATCH_BATCH_SIZE', 4)
+    info = run(main.PlatformHandler.get_spotify_track_info(PLAYLIST_URL))
+    results = run(collect(info['tracks']))
+    assert [track['id'] for track, _ in results] == [track['id'] for track in CATALOG[PLAYLIST_URL]]
+    assert [match.title for _, match in results] == [
+        f"{track['artist']} {track['title']}" for track in CATALOG[PLAYLIST_URL]
+    ]
+
+def test_short_titles_need_the_artist_for_the_boost():
+    track = {'id': 'spotify:go', 'artist': 'The Chemical Brothers', 'title': 'Go', 'duration': None}
+    unrelated = {'title': 'Let It Go - Frozen', 'channel': 'Disney'}
+    right = {'title': 'The Chemical Brothers - Go (Official Video)', 'channel': 'ChemicalBrothersVEVO'}
+    assert main.score_match(track, unrelated) < main.MATCH_MIN_SCORE
+    assert main.score_match(track, right) > main.MATCH_MIN_SCORE
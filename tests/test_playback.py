@@ -0,0 +1,237 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import main
+
+class FakeSource:
+    def __init__(self, title):
+        self.title = title
+        self.thumbnail = None
+        self.duration = None
+        self.cleaned_up = False
+
+    def cleanup(self):
+        self.cleaned_up = True
+
+class FakeVoiceClient:
+    def __init__(self, playing=False):
+        self.playing = playing
+        self.played = []
+
+    def is_playing(self):
+        return self.playing
+
+    def is_paused(self):
+        return False
+
+    def play(self, source, after=None):
+        self.played.append(source.title)
+        self.playing = True
+
+class FakeContext:
+    def __init__(self, playing=False):
+        self.guild = SimpleNamespace(id=1)
+        self.voice_client = FakeVoiceClient(playing)
+        self.sent = []
+
+    async def send(self, content=None, *, embed=None):
+        self.sent.append(embed or content)
+
+def make_info(prefix, count):
+    return {
+        'platform': 'Spotify',
+        'tracks': [
+            {'id': f'{prefix}{n}', 'artist': f'{prefix}{n}', 'title': f'Song {n}', 'duration': None}
+            for n in range(count)
+        ]
+    }
+
+def titles(songs):
+    return [song.title for song in songs]
+
+def expected(prefix, count):
+    return [f'{prefix}{n} Song {n}' for n in range(count)]
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    settings = SimpleNamespace(search_delay=0, load_delay=0, created=[])
+
+    def search(query):
+        time.sleep(settings.search_delay)
+        title = query.split(':', 1)[1]
+        return [{'id': title.replace(' ', ''), 'title': title, 'channel': 'Uploads'}]
+
+    async def create_source(self, *, loop=None):
+        await asyncio.sleep(settings.load_delay)
+        if self.title.startswith('Bad'):
+            raise RuntimeError('video unavailable')
+        source = FakeSource(self.title)
+        settings.created.append(source)
+        return source
+
+    monkeypatch.setattr(main, 'music_queues', {})
+    monkeypatch.setattr(main, 'resolved_track_cache', {})
+    monkeypatch.setattr(main, 'search_youtube', search)
+    monkeypatch.setattr(main.PendingTrack, 'create_source', create_source)
+    monkeypatch.setattr(main, 'MATCH_BATCH_SIZE', 2)
+    return settings
+
+def run(monkeypatch, coro_fn):
+    async def runner():
+        monkeypatch.setattr(main.bot, 'loop', asyncio.get_running_loop())
+        return await coro_fn()
+    return asyncio.run(runner())
+
+def test_first_batch_is_queued_right_away_and_rest_appended_in_order(monkeypatch, pipeline):
+    ctx = FakeContext(playing=True)
+    queue = main.get_queue(ctx.guild.id)
+
+    async def scenario():
+        assert await main.add_streaming_tracks(ctx, queue, make_info('A', 5))
+        assert titles(queue.queue) == expected('A', 2)
+        await asyncio.gather(*queue.resolve_tasks)
+
+    run(monkeypatch, scenario)
+    assert titles(queue.queue) == expected('A', 5)
+    assert ctx.sent[-1].title == '✅ Spotify Tracks Ready'
+
+def test_second_link_waits_for_the_first(monkeypatch, pipeline):
+    pipeline.search_delay = 0.01
+    ctx = FakeContext(playing=True)
+    queue = main.get_queue(ctx.guild.id)
+
+    async def scenario():
+        await main.add_streaming_tracks(ctx, queue, make_info('A', 5))
+        await main.add_streaming_tracks(ctx, queue, make_info('B', 3))
+        await asyncio.gather(*queue.resolve_tasks)
+
+    run(monkeypatch, scenario)
+    assert titles(queue.queue) == expected('A', 5) + expected('B', 3)
+    assert any(field.name == 'Waiting' for field in ctx.sent[1].fields)
+
+def test_clear_cancels_background_matching(monkeypatch, pipeline):
+    pipeline.search_delay = 0.02
+    ctx = FakeContext(playing=True)
+    queue = main.get_queue(ctx.guild.id)
+
+    async def scenario():
+        await main.add_streaming_tracks(ctx, queue, make_info('A', 10))
+        task = queue.resolve_tasks[0]
+        queue.clear()
+        await asyncio.sleep(0.2)
+        return task
+
+    task = run(monkeypatch, scenario)
+    assert task.cancelled()
+    assert not queue.queue
+
+def test_leading_misses_are_reported(monkeypatch, pipeline):
+    ctx = FakeContext(playing=True)
+    queue = main.get_queue(ctx.guild.id)
+    search = main.search_youtube
+    monkeypatch.setattr(main, 'search_youtube', lambda query: [] if 'A0' in query else search(query))
+
+    run(monkeypatch, lambda: main.add_streaming_tracks(ctx, queue, make_info('A', 2)))
+    assert titles(queue.queue) == ['A1 Song 1']
+    assert [field.name for field in ctx.sent[-1].fields if field.name.startswith('Not found')] == ['Not found (1)']
+
+def test_first_match_gives_up_after_a_few_batches(monkeypatch, pipeline):
+    calls = []
+    monkeypatch.setattr(main, 'search_youtube', lambda query: calls.append(query) or [])
+    ctx = FakeContext()
+    queue = main.get_queue(ctx.guild.id)
+
+    assert not run(monkeypatch, lambda: main.add_streaming_tracks(ctx, queue, make_info('A', 100)))
+    assert len(calls) == main.FIRST_MATCH_BATCHES * main.MATCH_BATCH_SIZE
+    assert not queue.resolve_tasks
+
+def test_playback_starting_while_rest_resolves_keeps_every_track(monkeypatch, pipeline):
+    pipeline.search_delay = 0.02
+    pipeline.load_delay = 0.3
+    ctx = FakeContext()
+    queue = main.get_queue(ctx.guild.id)
+
+    async def scenario():
+        # Same sequence as !play: queue the link, then start playback
+        await main.add_streaming_tracks(ctx, queue, make_info('A', 20))
+        await main.play_next(ctx)
+        await asyncio.gather(*queue.resolve_tasks)
+
+    run(monkeypatch, scenario)
+    assert ctx.voice_client.played == ['A0 Song 0']
+    assert queue.current.title == 'A0 Song 0'
+    assert titles(queue.queue) == expected('A', 20)[1:]
+    # Background batches must not start a second load while the first track is loading
+    assert titles(pipeline.created) == ['A0 Song 0']
+
+def test_background_matching_starts_playback_when_idle(monkeypatch, pipeline):
+    ctx = FakeContext()
+    queue = main.get_queue(ctx.guild.id)
+    queue.add_song(main.PendingTrack('url', 'Bad track'))
+    queue.current = main.PendingTrack('url', 'Finished')
+
+    async def scenario():
+        await main.add_streaming_tracks(ctx, queue, make_info('A', 4))
+        await asyncio.gather(*queue.resolve_tasks)
+
+    run(monkeypatch, scenario)
+    assert ctx.voice_client.played == ['A0 Song 0']
+
+def test_autoplay_waits_while_a_link_is_resolving(monkeypatch, pipeline):
+    related = []
+
+    async def get_related_song(song):
+        related.append(song.title)
+        return None
+
+    monkeypatch.setattr(main, 'get_related_song', get_related_song)
+    ctx = FakeContext()
+    queue = main.get_queue(ctx.guild.id)
+    queue.current = main.PendingTrack('url', 'Last track')
+
+    async def scenario():
+        task = asyncio.get_running_loop().create_task(asyncio.Event().wait())
+        queue.resolve_tasks.append(task)
+        await main.play_next(ctx)
+        assert related == []
+        task.cancel()
+        await asyncio.sleep(0)
+        await main.play_next(ctx)
+
+    run(monkeypatch, scenario)
+    assert related == ['Last track']
+
+def test_failed_load_is_skipped_and_dropped_from_loop_queue(monkeypatch, pipeline):
+    ctx = FakeContext()
+    queue = main.get_queue(ctx.guild.id)
+    queue.loop_queue = True
+    queue.add_song(main.PendingTrack('url', 'Bad track'))
+    queue.add_song(main.PendingTrack('url', 'Good track'))
+
+    run(monkeypatch, lambda: main.play_next(ctx))
+    assert ctx.voice_client.played == ['Good track']
+    assert titles(queue.queue) == ['Good track']
+    assert "Couldn't load **Bad track**" in ctx.sent[0]
+
+def test_track_is_put_back_if_something_else_starts_while_loading(monkeypatch, pipeline):
+    ctx = FakeContext()
+    queue = main.get_queue(ctx.guild.id)
+    previous = main.PendingTrack('url', 'Previous')
+    queue.current = previous
+    queue.add_song(main.PendingTrack('url', 'First'))
+    queue.add_song(main.PendingTrack('url', 'Second'))
+    load = main.PendingTrack.create_source
+
+    async def create_source(self, *, loop=None):
+        ctx.voice_client.playing = True
+        return await load(self, loop=loop)
+
+    monkeypatch.setattr(main.PendingTrack, 'create_source', create_source)
+    run(monkeypatch, lambda: main.play_next(ctx))
+    assert ctx.voice_client.played == []
+    assert titles(queue.queue) == ['First', 'Second']
+    assert queue.current is previous
+    assert pipeline.created[0].cleaned_up
@@ -0,0 +1,110 @@
+import asyncio
+
+import main
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+def spotify_item(track_id):
+    return {'id': track_id, 'name': f'Song {track_id}', 'duration_ms': 201500,
+            'artists': [{'name': 'Artist'}, {'name': 'Guest'}]}
+
+SPOTIFY_PAGES = {
+    'https://api.spotify.com/v1/playlists/abc123/tracks': {
+        # Local files come back with no track id
+        'items': [{'track': spotify_item('1')}, {'track': {'id': None, 'name': 'Local file'}}],
+        'next': 'https://api.spotify.com/v1/playlists/abc123/tracks?offset=2'
+    },
+    'https://api.spotify.com/v1/playlists/abc123/tracks?offset=2': {
+        'items': [{'track': spotify_item('2')}],
+        'next': None
+    },
+    'https://api.spotify.com/v1/tracks/xyz': spotify_item('xyz'),
+}
+
+def patch_spotify(monkeypatch):
+    calls = {'get': [], 'post': 0}
+
+    def post(url, **kwargs):
+        calls['post'] += 1
+        return FakeResponse({'access_token': 'token', 'expires_in': 3600})
+
+    def get(url, headers=None, params=None, timeout=None):
+        calls['get'].append(url)
+        assert headers == {'Authorization': 'Bearer token'}
+        return FakeResponse(SPOTIFY_PAGES[url])
+
+    monkeypatch.setattr(main.requests, 'post', post)
+    monkeypatch.setattr(main.requests, 'get', get)
+    return calls
+
+def test_spotify_playlist_follows_pagination(monkeypatch):
+    calls = patch_spotify(monkeypatch)
+    provider = main.WebMetadataProvider('id', 'secret')
+    tracks = provider._fetch_spotify('https://open.spotify.com/intl-de/playlist/abc123?si=share')
+    assert [track['id'] for track in tracks] == ['spotify:1', 'spotify:2']
+    assert tracks[0] == {'id': 'spotify:1', 'artist': 'Artist, Guest', 'title': 'Song 1', 'duration': 201}
+    assert len(calls['get']) == 2
+    assert calls['post'] == 1
+
+def test_spotify_pagination_stops_at_limit(monkeypatch):
+    calls = patch_spotify(monkeypatch)
+    provider = main.WebMetadataProvider('id', 'secret')
+    tracks = provider._fetch_spotify('https://open.spotify.com/playlist/abc123', limit=1)
+    assert [track['id'] for track in tracks] == ['spotify:1']
+    assert len(calls['get']) == 1
+
+def test_spotify_track_link(monkeypatch):
+    patch_spotify(monkeypatch)
+    provider = main.WebMetadataProvider('id', 'secret')
+    tracks = provider._fetch_spotify('https://open.spotify.com/intl-pt-BR/track/xyz?si=share')
+    assert [track['id'] for track in tracks] == ['spotify:xyz']
+
+def patch_itunes(monkeypatch):
+    calls = []
+
+    def get(url, params=None, timeout=None):
+        calls.append(params)
+        return FakeResponse({'results': [
+            {'wrapperType': 'collection', 'collectionName': 'Album'},
+            {'wrapperType': 'track', 'trackId': 456, 'artistName': 'Artist',
+             'trackName': 'Song', 'trackTimeMillis': 180000},
+        ]})
+
+    monkeypatch.setattr(main.requests, 'get', get)
+    return calls
+
+def test_apple_music_song_in_album_link(monkeypatch):
+    calls = patch_itunes(monkeypatch)
+    provider = main.WebMetadataProvider()
+    tracks = provider._fetch_apple_music('https://music.apple.com/gb/album/some-album/123?i=456')
+    assert calls == [{'id': '456', 'country': 'gb'}]
+    assert tracks == [{'id': 'apple:456', 'artist': 'Artist', 'title': 'Song', 'duration': 180}]
+
+def test_apple_music_album_without_country(monkeypatch):
+    calls = patch_itunes(monkeypatch)
+    provider = main.WebMetadataProvider()
+    provider._fetch_apple_music('https://music.apple.com/album/some-album/789')
+    assert calls == [{'id': '789', 'country': 'us', 'entity': 'song', 'limit': 200}]
+
+def test_apple_music_playlists_are_not_looked_up(monkeypatch):
+    calls = patch_itunes(monkeypatch)
+    provider = main.WebMetadataProvider()
+    assert provider._fetch_apple_music('https://music.apple.com/us/playlist/mix/pl.abc') is None
+    assert calls == []
+
+def test_long_links_are_truncated(monkeypatch):
+    url = 'https://open.spotify.com/playlist/long'
+    tracks = [{'id': f'spotify:{n}', 'artist': 'Artist', 'title': f'Song {n}', 'duration': None} for n in range(5)]
+    monkeypatch.setattr(main.PlatformHandler, 'metadata_provider', main.LocalMetadataProvider({url: tracks}))
+    monkeypatch.setattr(main.PlatformHandler, 'MAX_LINK_TRACKS', 3)
+    info = asyncio.run(main.PlatformHandler.get_spotify_track_info(url))
+    assert [track['id'] for track in info['tracks']] == ['spotify:0', 'spotify:1', 'spotify:2']
+    assert info['truncated']